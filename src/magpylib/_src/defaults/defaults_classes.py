@@ -1,4 +1,5 @@
 from magpylib._src.defaults.defaults_utility import (
+    NUMERIC_TYPES,
     SUPPORTED_PLOTTING_BACKENDS,
     MagicProperties,
     color_validator,
@@ -144,7 +145,7 @@ class Display(MagicProperties):
 
     @autosizefactor.setter
     def autosizefactor(self, val):
-        assert val is None or (isinstance(val, int | float) and val > 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val > 0), (
             f"the `autosizefactor` property of {type(self).__name__} must be a strictly positive"
             f" number but received {val!r} instead"
         )
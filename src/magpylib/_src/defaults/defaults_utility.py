@@ -7,8 +7,6 @@ import re
 from copy import deepcopy
 from functools import lru_cache
 
-from matplotlib.colors import CSS4_COLORS as mcolors
-
 from magpylib._src.defaults.defaults_values import DEFAULTS
 
 SUPPORTED_PLOTTING_BACKENDS = ("matplotlib", "plotly", "pyvista")
@@ -16,6 +14,9 @@ SUPPORTED_PLOTTING_BACKENDS = ("matplotlib", "plotly", "pyvista")
 
 ALLOWED_SYMBOLS = (".", "+", "D", "d", "s", "x", "o")
 
+# module level tuple, `int | float` would be rebuilt on each setter call
+NUMERIC_TYPES = (int, float)
+
 ALLOWED_LINESTYLES = (
     "solid",
     "dashed",
@@ -42,6 +43,18 @@ COLORS_SHORT_TO_LONG = {
     "w": "white",
 }
 
+# color strings are lowercased before matching
+HEX_COLOR_REGEX = re.compile(r"#(?:[0-9a-f]{6}|[0-9a-f]{3})", re.ASCII)
+
+
+@lru_cache(maxsize=1)
+def get_css_color_names():
+    """returns the named CSS colors, only imported from matplotlib on first call"""
+    # pylint: disable=import-outside-toplevel
+    from matplotlib.colors import CSS4_COLORS  # noqa: PLC0415
+
+    return frozenset(CSS4_COLORS)
+
 
 class _DefaultType:
     """Special keyword value.
@@ -108,21 +121,28 @@ def update_nested_dict(d, u, same_keys_only=False, replace_None_only=False) -> d
         if d is None or not replace_None_only:
             d = u.copy()
         return d
-    new_dict = deepcopy(d)
+    return _update_nested_dict_inplace(
+        deepcopy(d), u, same_keys_only, replace_None_only
+    )
+
+
+def _update_nested_dict_inplace(d, u, same_keys_only, replace_None_only) -> dict:
+    """updates recursively and in place the mapping `d` from dictionary `u`, see
+    `update_nested_dict`. `d` must already be a copy owned by the caller."""
     for k, v in u.items():
-        if k in new_dict or not same_keys_only:
-            if isinstance(v, collections.abc.Mapping):
-                new_dict[k] = update_nested_dict(
-                    new_dict.get(k, {}),
-                    v,
-                    same_keys_only=same_keys_only,
-                    replace_None_only=replace_None_only,
+        if same_keys_only and k not in d:
+            continue
+        if isinstance(v, collections.abc.Mapping):
+            sub = d.get(k, {})
+            if isinstance(sub, collections.abc.Mapping):
+                d[k] = _update_nested_dict_inplace(
+                    sub, v, same_keys_only, replace_None_only
                 )
-            elif (new_dict.get(k, None) is None or not replace_None_only) and (
-                not same_keys_only or k in new_dict
-            ):
-                new_dict[k] = v
-    return new_dict
+            elif sub is None or not replace_None_only:
+                d[k] = v.copy()
+        elif not replace_None_only or d.get(k, None) is None:
+            d[k] = v
+    return d
 
 
 def magic_to_dict(kwargs, separator="_") -> dict:
@@ -146,18 +166,16 @@ def magic_to_dict(kwargs, separator="_") -> dict:
     assert isinstance(separator, str), "separator must be a string"
     new_kwargs = {}
     for k, v in kwargs.items():
-        keys = k.split(separator)
-        if len(keys) == 1:
-            new_kwargs[keys[0]] = v
-        else:
-            val = {separator.join(keys[1:]): v}
-            if keys[0] in new_kwargs and isinstance(new_kwargs[keys[0]], dict):
-                new_kwargs[keys[0]].update(val)
-            else:
-                new_kwargs[keys[0]] = val
-    for k, v in new_kwargs.items():
-        if isinstance(v, dict):
-            new_kwargs[k] = magic_to_dict(v, separator=separator)
+        # walk down the nested dictionary, splitting the key only once per level
+        d = new_kwargs
+        head, sep, tail = k.partition(separator)
+        while sep:
+            sub = d.get(head)
+            if not isinstance(sub, dict):
+                sub = d[head] = {}
+            d = sub
+            head, sep, tail = tail.partition(separator)
+        d[head] = magic_to_dict(v, separator=separator) if isinstance(v, dict) else v
     return new_kwargs
 
 
@@ -206,7 +224,6 @@ def linearize_dict(kwargs, separator=".") -> dict:
     return dict_
 
 
-@lru_cache(maxsize=1000)
 def color_validator(color_input, allow_None=True, parent_name=""):
     """validates color inputs based on chosen `backend', allows `None` by default.
 
@@ -229,6 +246,15 @@ def color_validator(color_input, allow_None=True, parent_name=""):
     ValueError
         raises ValueError inf validation fails
     """
+    if isinstance(color_input, tuple | list):
+        # not cached: (1, 0, 0) and (1.0, 0.0, 0.0) hash the same but are
+        # different colors, lists are not hashable
+        return _validate_color(color_input, allow_None, parent_name)
+    return _color_validator(color_input, allow_None, parent_name)
+
+
+def _validate_color(color_input, allow_None, parent_name):
+    """implementation of `color_validator`"""
     if allow_None and color_input is None:
         return color_input
 
@@ -271,10 +297,9 @@ def color_validator(color_input, allow_None=True, parent_name=""):
             if len(color_new) == 3:
                 c = tuple(color_new)
                 color_new = f"#{c[0]:02x}{c[1]:02x}{c[2]:02x}"
-        re_hex = re.compile(r"#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})")
-        fail = not re_hex.fullmatch(color_new)
+        fail = not HEX_COLOR_REGEX.fullmatch(color_new)
 
-    if fail and str(color_new) not in mcolors:
+    if fail and str(color_new) not in get_css_color_names():
         msg = (
             f"Invalid value of type '{type(color_input)}' "
             f"received for the color property of {parent_name}"
@@ -284,12 +309,15 @@ def color_validator(color_input, allow_None=True, parent_name=""):
             "    - A rgb string (e.g. 'rgb(185,204,255)')\n"
             "    - A rgb tuple (e.g. (120,125,126))\n"
             "    - A number between 0 and 1 (for grey scale) (e.g. '.5' or .8)\n"
-            f"    - A named CSS color:\n{list(mcolors.keys())}"
+            f"    - A named CSS color:\n{sorted(get_css_color_names())}"
         )
         raise ValueError(msg)
     return color_new
 
 
+_color_validator = lru_cache(maxsize=1000)(_validate_color)
+
+
 def validate_property_class(val, name, class_, parent):
     """validator for sub property"""
     if isinstance(val, dict):
@@ -306,18 +334,24 @@ def validate_property_class(val, name, class_, parent):
     return val
 
 
+@lru_cache(maxsize=1)
+def _get_valid_style_keys():
+    """returns the set of style keys available in the hard coded defaults"""
+    styles_by_family = DEFAULTS["display"]["style"]
+    return frozenset(key for v in styles_by_family.values() for key in v)
+
+
 def validate_style_keys(style_kwargs):
     """validates style kwargs based on key up to first underscore.
     checks in the defaults structures the generally available style keys"""
-    styles_by_family = get_defaults_dict("display.style")
-    valid_keys = {key for v in styles_by_family.values() for key in v}
+    valid_keys = _get_valid_style_keys()
     level0_style_keys = {k.split("_")[0]: k for k in style_kwargs}
     kwargs_diff = set(level0_style_keys).difference(valid_keys)
     invalid_keys = {level0_style_keys[k] for k in kwargs_diff}
     if invalid_keys:
         msg = (
             f"Following arguments are invalid style properties: `{invalid_keys}`\n"
-            f"\n Available style properties are: `{valid_keys}`"
+            f"\n Available style properties are: `{set(valid_keys)}`"
         )
         raise ValueError(msg)
     return style_kwargs
@@ -338,25 +372,44 @@ class MagicProperties:
     )
 
     __isfrozen = False
+    _property_names = ()
+    _property_attrs = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._property_names = tuple(
+            attr for attr in dir(cls) if isinstance(getattr(cls, attr, None), property)
+        )
+        # (property name, private attribute name) pairs used for fast reads
+        cls._property_attrs = tuple((k, f"_{k}") for k in cls._property_names)
 
     def __init__(self, **kwargs):
         input_dict = dict.fromkeys(self._property_names_generator())
         if kwargs:
-            magic_kwargs = magic_to_dict(kwargs)
-            diff = set(magic_kwargs.keys()).difference(set(input_dict.keys()))
-            for attr in diff:
-                msg = (
-                    f"{type(self).__name__} has no property '{attr}'"
-                    f"\n Available properties are: {list(self._property_names_generator())}"
-                )
-                raise AttributeError(msg)
+            # magic parsing only changes keys with underscores or nested dict values
+            if any("_" in k or isinstance(v, dict) for k, v in kwargs.items()):
+                magic_kwargs = magic_to_dict(kwargs)
+            else:
+                magic_kwargs = kwargs
+            for attr in magic_kwargs:
+                if attr not in input_dict:
+                    msg = (
+                        f"{type(self).__name__} has no property '{attr}'"
+                        f"\n Available properties are: {list(self._property_names_generator())}"
+                    )
+                    raise AttributeError(msg)
             input_dict.update(magic_kwargs)
         for k, v in input_dict.items():
             setattr(self, k, v)
         self._freeze()
 
     def __setattr__(self, key, value):
-        if self.__isfrozen and not hasattr(self, key):
+        # property names are checked first to avoid calling the getter via `hasattr`
+        if (
+            self.__isfrozen
+            and key not in self._property_names
+            and not hasattr(self, key)
+        ):
             msg = (
                 f"{type(self).__name__} has no property '{key}'"
                 f"\n Available properties are: {list(self._property_names_generator())}"
@@ -368,12 +421,8 @@ class MagicProperties:
         self.__isfrozen = True
 
     def _property_names_generator(self):
-        """returns a generator with class properties only"""
-        return (
-            attr
-            for attr in dir(self)
-            if isinstance(getattr(type(self), attr, None), property)
-        )
+        """returns a tuple with class properties only, computed once per class"""
+        return self._property_names
 
     def __repr__(self):
         params = self._property_names_generator()
@@ -394,16 +443,33 @@ class MagicProperties:
             the separator to be used when flattening the dictionary. Only applies if
             `flatten=True`
         """
-        params = self._property_names_generator()
+        if flatten:
+            return self._as_flat_dict({}, "", separator)
+        attrs = self.__dict__
         dict_ = {}
-        for k in params:
-            val = getattr(self, k)
+        for k, attr in self._property_attrs:
+            # read the stored value directly, fall back to the getter for computed properties
+            val = attrs[attr] if attr in attrs else getattr(self, k)
             if hasattr(val, "as_dict"):
                 dict_[k] = val.as_dict()
             else:
                 dict_[k] = val
-        if flatten:
-            dict_ = linearize_dict(dict_, separator=separator)
+        return dict_
+
+    def _as_flat_dict(self, dict_, prefix, separator):
+        """writes the flattened properties into `dict_` with keys starting with `prefix`,
+        same as `linearize_dict(self.as_dict())` without the intermediate nested dictionaries"""
+        attrs = self.__dict__
+        for k, attr in self._property_attrs:
+            val = attrs[attr] if attr in attrs else getattr(self, k)
+            key = f"{prefix}{k}"
+            if isinstance(val, MagicProperties):
+                val._as_flat_dict(dict_, f"{key}{separator}", separator)
+            elif isinstance(val, dict):
+                for k2, v2 in linearize_dict(val, separator=separator).items():
+                    dict_[f"{key}{separator}{k2}"] = v2
+            else:
+                dict_[key] = val
         return dict_
 
     def update(
@@ -442,6 +508,38 @@ class MagicProperties:
             setattr(self, k, v)
         return self
 
+    def _fill_defaults(self, defaults):
+        """
+        Sets properties that are `None` from the nested `defaults` dictionary, in place.
+        Equivalent to `update(defaults, _match_properties=False, _replace_None_only=True)`
+        but only the setters of unset properties are called.
+
+        Parameters
+        ----------
+        defaults: dict
+            nested dictionary of default values, keys not matching a property are ignored
+
+        Returns
+        -------
+        self
+        """
+        attrs = self.__dict__
+        for k, attr in self._property_attrs:
+            if k not in defaults:
+                continue
+            val = attrs[attr] if attr in attrs else getattr(self, k)
+            if val is None:
+                setattr(self, k, defaults[k])
+            elif isinstance(val, MagicProperties) and isinstance(defaults[k], dict):
+                val._fill_defaults(defaults[k])
+        return self
+
     def copy(self):
         """returns a copy of the current class instance"""
-        return deepcopy(self)
+        # copy stored attributes directly, nested properties are copied recursively
+        # without going through the generic `deepcopy` machinery or the setters
+        new = object.__new__(type(self))
+        new_attrs = new.__dict__
+        for k, v in self.__dict__.items():
+            new_attrs[k] = v.copy() if isinstance(v, MagicProperties) else deepcopy(v)
+        return new
@@ -78,14 +78,57 @@ def colormap_from_colorscale(colorscale, name="plotly_to_mpl", N=256, gamma=1.0)
     return LinearSegmentedColormap(name, cdict, N, gamma)
 
 
+def color_to_int_rgb(color):
+    """Convert a color to an `(r, g, b)` tuple of integers, black if `None`"""
+    if isinstance(color, str):
+        return _color_to_int_rgb(color)
+    # numeric colors are not cached: (1, 0, 0) and (1.0, 0.0, 0.0) hash the same
+    # but pyvista reads ints on the 0-255 scale and floats on the 0-1 scale
+    return Color(color, default_color=(0, 0, 0)).int_rgb
+
+
+@lru_cache(maxsize=1024)
+def _color_to_int_rgb(color):
+    """Cached conversion of a color string, mesh face colors repeat a lot"""
+    return Color(color, default_color=(0, 0, 0)).int_rgb
+
+
+def facecolor_to_int_rgb(facecolor):
+    """Convert an array of face colors to an `(n, 3)` array of integer rgb values.
+    Each distinct color is only converted once and mapped back onto the faces."""
+    facecolor = np.array(facecolor)
+    if facecolor.ndim == 2 and facecolor.dtype.kind in "iuf":
+        # numeric rgb rows, one array dtype so int and float rows do not mix
+        uniq, inv = np.unique(facecolor, axis=0, return_inverse=True)
+    elif facecolor.ndim != 1:
+        return np.array([color_to_int_rgb(c) for c in facecolor], dtype=np.uint8)
+    else:
+        facecolor[facecolor == np.array(None)] = "black"
+        uniq, inv = np.unique(facecolor, return_inverse=True)
+    lut = np.array([color_to_int_rgb(c) for c in uniq], dtype=np.uint8)
+    return lut[inv.ravel()]
+
+
+def is_color_sequence(color):
+    """Return True if `color` is a sequence of colors rather than a single color"""
+    if color is None or isinstance(color, str):
+        return False
+    color = np.asarray(color)
+    return color.ndim == 2 or (color.ndim == 1 and color.dtype.kind in "UO")
+
+
 def generic_trace_to_pyvista(trace):
     """Transform a generic trace into a pyvista trace"""
     traces_pv = []
     leg_title = trace.get("legendgrouptitle_text", None)
     if trace["type"] == "mesh3d":
-        vertices = np.array([trace[k] for k in "xyz"], dtype=float).T
-        faces = np.array([trace[k] for k in "ijk"]).T.flatten()
-        faces = np.insert(faces, range(0, len(faces), 3), 3)
+        vertices = np.column_stack([trace[k] for k in "xyz"]).astype(float, copy=False)
+        # pyvista faces layout: [3, i0, j0, k0, 3, i1, j1, k1, ...]
+        ijk = np.column_stack([trace[k] for k in "ijk"])
+        faces = np.empty((len(ijk), 4), dtype=int)
+        faces[:, 0] = 3
+        faces[:, 1:] = ijk
+        faces = faces.ravel()
         colorscale = trace.get("colorscale", None)
         mesh = pv.PolyData(vertices, faces)
         facecolor = trace.get("facecolor", None)
@@ -98,9 +141,7 @@ def generic_trace_to_pyvista(trace):
         }
         if facecolor is not None:
             # pylint: disable=unsupported-assignment-operation
-            mesh.cell_data["colors"] = [
-                Color(c, default_color=(0, 0, 0)).int_rgb for c in facecolor
-            ]
+            mesh.cell_data["colors"] = facecolor_to_int_rgb(facecolor)
             trace_pv.update(
                 {
                     "scalars": "colors",
@@ -129,11 +170,35 @@ def generic_trace_to_pyvista(trace):
             if "lines" in mode:
                 trace_pv_line = {
                     "type": "mesh",
-                    "mesh": pv.lines_from_points(points),
-                    "color": line_color,
                     "line_width": line_width,
                     "opacity": trace.get("opacity", None),
                 }
+                nseg = len(points) - 1
+                if is_color_sequence(line_color) and (
+                    nseg < 1 or len(line_color) < nseg
+                ):
+                    # not enough colors for one per segment -> single color
+                    line_color = line_color[0]
+                if is_color_sequence(line_color):
+                    # one color per point -> single polydata with a color per segment
+                    lines = np.empty((nseg, 3), dtype=int)
+                    lines[:, 0] = 2
+                    lines[:, 1] = np.arange(nseg)
+                    lines[:, 2] = lines[:, 1] + 1
+                    mesh = pv.PolyData(points, lines=lines.ravel())
+                    # pylint: disable=unsupported-assignment-operation
+                    mesh.cell_data["colors"] = facecolor_to_int_rgb(line_color[:nseg])
+                    trace_pv_line.update(
+                        {
+                            "mesh": mesh,
+                            "scalars": "colors",
+                            "rgb": True,
+                            "preference": "cell",
+                        }
+                    )
+                else:
+                    trace_pv_line["mesh"] = pv.lines_from_points(points)
+                    trace_pv_line["color"] = line_color
                 traces_pv.append(trace_pv_line)
             if "markers" in mode:
                 trace_pv_marker = {
@@ -180,13 +245,20 @@ def generic_trace_to_pyvista(trace):
                     if isinstance(marker_size, list | tuple | np.ndarray)
                     else np.array([marker_size])
                 )
-                for size in np.unique(marker_size):
-                    tr = trace_pv_marker.copy()
-                    mask = marker_size == size
+                # one scatter per marker size, points grouped in a single sort
+                x, y = np.asarray(trace["x"]), np.asarray(trace["y"])
+                sizes, size_inds = np.unique(marker_size, return_inverse=True)
+                if len(sizes) == 1:
+                    groups = [slice(None)]
+                else:
+                    size_inds = size_inds.ravel()
+                    order = np.argsort(size_inds, kind="stable")
+                    groups = np.split(order, np.cumsum(np.bincount(size_inds))[:-1])
+                for size, inds in zip(sizes, groups, strict=True):
                     tr = {
-                        **tr,
-                        "x": np.array(tr["x"])[mask],
-                        "y": np.array(tr["y"][mask]),
+                        **trace_pv_marker,
+                        "x": x[inds],
+                        "y": y[inds],
                         "size": size,
                     }
                     traces_pv.append(tr)
@@ -251,38 +323,50 @@ def display_pyvista(
         jupyter_backend = pv.global_theme.jupyter_backend
     count_with_labels = {}
     charts_max_ind = 0
+    is_scene = {
+        rc: spec["type"] == "scene" for rc, spec in np.ndenumerate(subplot_specs)
+    }
+    canvas_adders = {}
 
     def draw_frame(frame_ind):
         nonlocal count_with_labels, charts_max_ind
         frame = frames[frame_ind]
+        # group traces by subplot to switch the active renderer once per subplot
+        subplot_traces = {}
         for tr0 in frame["data"]:
             for tr1 in generic_trace_to_pyvista(tr0):
                 row = tr1.pop("row", 1)
                 col = tr1.pop("col", 1)
+                subplot_traces.setdefault((row, col), []).append(tr1)
+        for (row, col), traces in subplot_traces.items():
+            if frame_ind == 0:
+                count = sum(1 for tr1 in traces if tr1.get("label", ""))
+                count_with_labels[(row, col)] = (
+                    count_with_labels.get((row, col), 0) + count
+                )
+            canvas.subplot(row, col)
+            scene = is_scene[(row, col)]
+            if not scene and charts.get((row, col), None) is None:
+                charts_max_ind += 1
+                charts[(row, col)] = pv.Chart2D()
+                canvas.add_chart(charts[(row, col)])
+            for tr1 in traces:
                 typ = tr1.pop("type")
-                if frame_ind == 0:
-                    if (row, col) not in count_with_labels:
-                        count_with_labels[(row, col)] = 0
-                    if tr1.get("label", ""):
-                        count_with_labels[(row, col)] += 1
-                canvas.subplot(row, col)
-                if subplot_specs[row, col]["type"] == "scene":
-                    getattr(canvas, f"add_{typ}")(**tr1)
+                if scene:
+                    if typ not in canvas_adders:
+                        canvas_adders[typ] = getattr(canvas, f"add_{typ}")
+                    canvas_adders[typ](**tr1)
+                    with contextlib.suppress(StopIteration, IndexError):
+                        canvas.remove_scalar_bar()
+                        # needs to happen in the loop otherwise they cummulate
+                        # while the max of 10 is reached and throws a ValueError
                 else:
-                    if charts.get((row, col), None) is None:
-                        charts_max_ind += 1
-                        charts[(row, col)] = pv.Chart2D()
-                        canvas.add_chart(charts[(row, col)])
                     getattr(charts[(row, col)], typ)(**tr1)
             # in pyvista there is no way to set the bounds so we add corners with
             # a transparent scatter plot to set the ranges and zoom correctly
             ranges = data["ranges"][row + 1, col + 1]
             pts = np.array(np.meshgrid(*ranges)).T.reshape(-1, 3)
             canvas.add_mesh(pv.PolyData(pts), opacity=0)
-            with contextlib.suppress(StopIteration, IndexError):
-                canvas.remove_scalar_bar()
-                # needs to happen in the loop otherwise they cummulate
-                # while the max of 10 is reached and throws a ValueError
 
         for (row, col), count in count_with_labels.items():
             canvas.subplot(row, col)
@@ -292,10 +376,7 @@ def display_pyvista(
                     canvas.show_axes()
                 canvas.camera.azimuth = -90
                 canvas.set_background("gray", top="white")
-            if (
-                0 < count <= legend_maxitems
-                and subplot_specs[row, col]["type"] == "scene"
-            ):
+            if 0 < count <= legend_maxitems and is_scene[(row, col)]:
                 canvas.add_legend(bcolor=None)
 
     def run_animation(filename, embed=True):
@@ -6,7 +6,7 @@ a circular current loop. Computation details in function docstrings.
 import numpy as np
 from scipy.constants import mu_0 as MU0
 
-from magpylib._src.fields.special_cel import cel_iter
+from magpylib._src.fields.special_cel import cel_iter_pair
 from magpylib._src.input_checks import check_field_input
 from magpylib._src.utility import cart_to_cyl_coordinates, cyl_field_to_cart
 
@@ -80,20 +80,24 @@ def current_circle_Hfield(
     k = np.sqrt(k2)
     q = np.sqrt(q2)
     p = 1 + q
-    pf = k / np.sqrt(r) / q2 / 20 / r0 * 1e-6 * i0
+    # input is I -> output must be H-field: *1e7/4/np.pi
+    pf = k / np.sqrt(r) / q2 / 20 / r0 * 1e-6 * 795774.7154594767 * i0
 
     # cel* part
-    cc = k2 * k2
-    ss = 2 * cc * q / p
-    Hr = pf * z / r * cel_iter(q, p, np.ones(n5), cc, ss, p, q)
+    cc1 = k2 * k2
+    ss1 = 2 * cc1 * q / p
 
     # cel** part
-    cc = k2 * (k2 - (q2 + 1) / r)
-    ss = 2 * k2 * q * (k2 / p - p / r)
-    Hz = -pf * cel_iter(q, p, np.ones(n5), cc, ss, p, q)
+    cc2 = k2 * (k2 - (q2 + 1) / r)
+    ss2 = 2 * k2 * q * (k2 / p - p / r)
 
-    # input is I -> output must be H-field
-    return np.vstack((Hr, np.zeros(n5), Hz)) * 795774.7154594767  # *1e7/4/np.pi
+    # both cel parts share q and p -> single iteration
+    cel1, cel2 = cel_iter_pair(q, p, cc1, ss1, cc2, ss2)
+
+    H = np.zeros((3, n5))
+    H[0] = pf * z / r * cel1
+    H[2] = -pf * cel2
+    return H
 
 
 def BHJM_circle(
@@ -117,32 +121,44 @@ def BHJM_circle(
     r, phi, z = cart_to_cyl_coordinates(observers)
     r0 = np.abs(diameter / 2)
 
+    # work on contiguous cylindrical components, written to BHJM at the end
+    Hr = np.zeros(len(r))
+    Hz = np.zeros(len(r))
+
     # Special cases:
     # case1: loop radius is 0 -> return (0,0,0)
     mask1 = r0 == 0
     # case2: at singularity -> return (0,0,0)
-    mask2 = np.logical_and(abs(r - r0) < 1e-15 * r0, z == 0)
+    dr = np.subtract(r, r0)
+    np.abs(dr, out=dr)
+    mask2 = dr < 1e-15 * r0
+    mask2 &= z == 0
     # case3: r=0
     mask3 = r == 0
     if np.any(mask3):
         mask4 = mask3 * ~mask1  # only relevant if not also case1
-        BHJM[mask4, 2] = (
+        Hz[mask4] = (
             (r0[mask4] ** 2 / (z[mask4] ** 2 + r0[mask4] ** 2) ** (3 / 2))
             * current[mask4]
             * 0.5
         )
 
-    # general case
-    mask5 = ~np.logical_or(np.logical_or(mask1, mask2), mask3)
+    # general case - combine masks in place, no intermediate boolean arrays
+    mask5 = np.logical_or(mask1, mask2, out=mask2)
+    np.logical_or(mask5, mask3, out=mask5)
+    np.logical_not(mask5, out=mask5)
     if np.any(mask5):
-        BHJM[mask5] = current_circle_Hfield(
+        H = current_circle_Hfield(
             r0=r0[mask5],
             r=r[mask5],
             z=z[mask5],
             i0=current[mask5],
-        ).T
+        )
+        Hr[mask5] = H[0]
+        Hz[mask5] = H[2]
 
-    BHJM[:, 0], BHJM[:, 1] = cyl_field_to_cart(phi, BHJM[:, 0])
+    BHJM[:, 0], BHJM[:, 1] = cyl_field_to_cart(phi, Hr)
+    BHJM[:, 2] = Hz
 
     if field == "H":
         return BHJM
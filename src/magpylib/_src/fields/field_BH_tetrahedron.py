@@ -10,6 +10,18 @@ from magpylib._src.fields.field_BH_triangle import BHJM_triangle
 from magpylib._src.input_checks import check_field_input
 
 
+def triple_product(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Row-wise scalar triple product a . (b x c) of vector arrays of shape (m x 3),
+    which is the determinant of the 3x3 matrices with columns a, b, c.
+    """
+    return (
+        a[:, 0] * (b[:, 1] * c[:, 2] - b[:, 2] * c[:, 1])
+        + a[:, 1] * (b[:, 2] * c[:, 0] - b[:, 0] * c[:, 2])
+        + a[:, 2] * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+    )
+
+
 def check_chirality(points: np.ndarray) -> np.ndarray:
     """
     Checks if quadruple of points (p0,p1,p2,p3) that forms tetrahedron is arranged in a way
@@ -26,12 +38,9 @@ def check_chirality(points: np.ndarray) -> np.ndarray:
     tetrahedron is given in a right-handed system.
     """
 
-    vecs = np.zeros((len(points), 3, 3))
-    vecs[:, :, 0] = points[:, 1, :] - points[:, 0, :]
-    vecs[:, :, 1] = points[:, 2, :] - points[:, 0, :]
-    vecs[:, :, 2] = points[:, 3, :] - points[:, 0, :]
-
-    dets = np.linalg.det(vecs)
+    # det of the edge vectors p0p1, p0p2, p0p3 as scalar triple product
+    edges = points[:, 1:, :] - points[:, :1, :]
+    dets = triple_product(edges[:, 0], edges[:, 1], edges[:, 2])
     dets_neg = dets < 0
 
     if np.any(dets_neg):
@@ -44,23 +53,38 @@ def point_inside(points: np.ndarray, vertices: np.ndarray, in_out: str) -> np.nd
     """
     Takes points, as well as the vertices of a tetrahedra.
     Returns boolean array indicating whether the points are inside the tetrahedra.
+    Points on the surface (faces, edges and vertices) are considered inside,
+    down to a relative tolerance. Degenerate (zero-volume) tetrahedra contain
+    no points.
     """
-    if in_out == "inside":
-        return np.array([True] * len(points))
 
-    if in_out == "outside":
-        return np.array([False] * len(points))
+    RTOL_SURFACE = 1e-10  # relative tolerance to be considered on surface
 
-    mat = vertices[:, 1:].swapaxes(0, 1) - vertices[:, 0]
-    mat = np.transpose(mat.swapaxes(0, 1), (0, 2, 1))
+    if in_out == "inside":
+        return np.ones(len(points), dtype=bool)
 
-    tetra = np.linalg.inv(mat)
-    newp = np.matmul(tetra, np.reshape(points - vertices[:, 0, :], (*points.shape, 1)))
+    if in_out == "outside":
+        return np.zeros(len(points), dtype=bool)
+
+    # barycentric coordinates of the points by Cramer's rule, kept multiplied
+    # by |det| to avoid the division (degenerate tetrahedra contain no points)
+    e1, e2, e3 = (vertices[:, i, :] - vertices[:, 0, :] for i in (1, 2, 3))
+    d = points - vertices[:, 0, :]
+    det = triple_product(e1, e2, e3)
+    sign = np.sign(det)
+    det = np.abs(det)
+    newp = np.stack(
+        (
+            triple_product(d, e2, e3),
+            triple_product(e1, d, e3),
+            triple_product(e1, e2, d),
+        )
+    )
+    newp *= sign
+    tol = RTOL_SURFACE * det
     return (
-        np.all(newp >= 0, axis=1)
-        & np.all(newp <= 1, axis=1)
-        & (np.sum(newp, axis=1) <= 1)
-    ).flatten()
+        (det > 0) & np.all(newp >= -tol, axis=0) & (np.sum(newp, axis=0) <= det + tol)
+    )
 
 
 def BHJM_magnet_tetrahedron(
@@ -93,28 +117,21 @@ def BHJM_magnet_tetrahedron(
 
     vertices = check_chirality(vertices)
 
-    tri_vertices = np.concatenate(
-        (
-            vertices[:, (0, 2, 1), :],
-            vertices[:, (0, 1, 3), :],
-            vertices[:, (1, 2, 3), :],
-            vertices[:, (0, 3, 2), :],
-        ),
-        axis=0,
-    )
-    tri_field = BHJM_triangle(
+    # sum up the fields of the 4 outward oriented faces, one call per face
+    # avoids tiling observers and polarization 4 times
+    BHJM = BHJM_triangle(
         field=field,
-        observers=np.tile(observers, (4, 1)),
-        vertices=tri_vertices,
-        polarization=np.tile(polarization, (4, 1)),
-    )
-    n = len(observers)
-    BHJM = (  # slightly faster than reshape + sum
-        tri_field[:n]
-        + tri_field[n : 2 * n]
-        + tri_field[2 * n : 3 * n]
-        + tri_field[3 * n :]
+        observers=observers,
+        vertices=vertices[:, (0, 2, 1), :],
+        polarization=polarization,
     )
+    for face in ((0, 1, 3), (1, 2, 3), (0, 3, 2)):
+        BHJM += BHJM_triangle(
+            field=field,
+            observers=observers,
+            vertices=vertices[:, face, :],
+            polarization=polarization,
+        )
 
     if field == "H":
         return BHJM
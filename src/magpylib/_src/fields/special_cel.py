@@ -187,3 +187,29 @@ def cel_iterv(qc, p, g, cc, ss, em, kk):
         g = em
         em = em + qc
     return 1.5707963267948966 * (ss + cc * em) / (em * (em + p))
+
+
+def cel_iter_pair(qc, p, cc1, ss1, cc2, ss2):
+    """
+    Iterative part of Bulirsch cel algorithm for two (cc, ss) pairs sharing
+    the same qc and p, evaluated in a single pass. Equivalent to
+    cel_iter(qc, p, 1, cc, ss, p, qc) for each pair.
+    """
+    g = 1.0
+    em = p
+    kk = qc
+    while np.any(np.fabs(g - qc) >= qc * 1e-8):
+        qc = 2 * np.sqrt(kk)
+        kk = qc * em
+        f1 = cc1
+        f2 = cc2
+        cc1 = cc1 + ss1 / p
+        cc2 = cc2 + ss2 / p
+        g = kk / p
+        ss1 = 2 * (ss1 + f1 * g)
+        ss2 = 2 * (ss2 + f2 * g)
+        p = p + g
+        g = em
+        em = em + qc
+    den = 1.5707963267948966 / (em * (em + p))
+    return (ss1 + cc1 * em) * den, (ss2 + cc2 * em) * den
@@ -19,6 +19,8 @@ from magpylib._src.utility import format_obj_input, wrong_obj_msg
 
 # pylint: disable=no-member
 
+FIELD_TYPES = ("B", "H", "M", "J")
+
 #################################################################
 #################################################################
 # FUNDAMENTAL CHECKS
@@ -29,43 +31,41 @@ def all_same(lst: list) -> bool:
     return lst[1:] == lst[:-1]
 
 
-def is_array_like(inp, msg: str):
+def is_array_like(inp) -> bool:
     """test if inp is array_like: type list, tuple or ndarray
     inp: test object
-    msg: str, error msg
     """
-    if not isinstance(inp, list | tuple | np.ndarray):
-        raise MagpylibBadUserInput(msg)
+    return isinstance(inp, list | tuple | np.ndarray)
 
 
-def make_float_array(inp, msg: str):
+def make_float_array(inp, param_name: str):
     """transform inp to array with dtype=float, throw error with bad input
     inp: test object
-    msg: str, error msg
+    param_name: str, parameter name used in the error msg
     """
     try:
         inp_array = np.array(inp, dtype=float)
     except Exception as err:
-        raise MagpylibBadUserInput(msg + f"{err}") from err
+        msg = (
+            f"Input parameter `{param_name}` must contain only float compatible "
+            f"entries.\n{err}"
+        )
+        raise MagpylibBadUserInput(msg) from err
     return inp_array
 
 
-def check_array_shape(inp: np.ndarray, dims: tuple, shape_m1: int, length=None, msg=""):
-    """check if inp shape is allowed
+def has_array_shape(inp: np.ndarray, dims: tuple, shape_m1: int, length=None) -> bool:
+    """test if inp shape is allowed
     inp: test object
     dims: list, list of allowed dims
     shape_m1: shape of lowest level, if 'any' allow any shape
-    msg: str, error msg
+    length: int, if given the required length of the first axis instead of shape_m1
     """
     if inp.ndim in dims:
         if length is None:
-            if inp.shape[-1] == shape_m1:
-                return
-            if shape_m1 == "any":
-                return
-        elif len(inp) == length:
-            return
-    raise MagpylibBadUserInput(msg)
+            return inp.shape[-1] == shape_m1 or shape_m1 == "any"
+        return len(inp) == length
+    return False
 
 
 def check_input_zoom(inp):
@@ -119,9 +119,8 @@ def check_degree_type(inp):
 
 def check_field_input(inp):
     """check field input"""
-    allowed = tuple("BHMJ")
-    if not (isinstance(inp, str) and inp in allowed):
-        msg = f"`field` input can only be one of {allowed}.\nInstead received {inp!r}."
+    if not (isinstance(inp, str) and inp in FIELD_TYPES):
+        msg = f"`field` input can only be one of {FIELD_TYPES}.\nInstead received {inp!r}."
         raise MagpylibBadUserInput(msg)
 
 
@@ -330,29 +329,24 @@ def check_format_input_vector(
     if allow_None and inp is None:
         return None
 
-    is_array_like(
-        inp,
-        f"Input parameter `{sig_name}` must be {sig_type}.\n"
-        f"Instead received type {type(inp)!r}.",
-    )
-    inp = make_float_array(
-        inp,
-        f"Input parameter `{sig_name}` must contain only float compatible entries.\n",
-    )
-    check_array_shape(
-        inp,
-        dims=dims,
-        shape_m1=shape_m1,
-        length=length,
-        msg=(
+    # error messages are only formatted on failure, setters call this a lot
+    if not is_array_like(inp):
+        msg = (
+            f"Input parameter `{sig_name}` must be {sig_type}.\n"
+            f"Instead received type {type(inp)!r}."
+        )
+        raise MagpylibBadUserInput(msg)
+    inp = make_float_array(inp, sig_name)
+    if not has_array_shape(inp, dims=dims, shape_m1=shape_m1, length=length):
+        msg = (
             f"Input parameter `{sig_name}` must be {sig_type}.\n"
             f"Instead received array_like with shape {inp.shape}."
-        ),
-    )
+        )
+        raise MagpylibBadUserInput(msg)
     if isinstance(reshape, tuple):
         return np.reshape(inp, reshape)
 
-    if forbid_negative0 and np.any(inp <= 0):
+    if forbid_negative0 and (inp <= 0).any():
         msg = f"Input parameter `{sig_name}` cannot have values <= 0."
         raise MagpylibBadUserInput(msg)
     return inp
@@ -368,15 +362,13 @@ def check_format_input_vector2(
     - convert inp to ndarray with dtype float
     - make sure that inp.ndim = target_ndim, None dimensions are ignored
     """
-    is_array_like(
-        inp,
-        f"Input parameter `{param_name}` must be array_like.\n"
-        f"Instead received type {type(inp)!r}.",
-    )
-    inp = make_float_array(
-        inp,
-        f"Input parameter `{param_name}` must contain only float compatible entries.\n",
-    )
+    if not is_array_like(inp):
+        msg = (
+            f"Input parameter `{param_name}` must be array_like.\n"
+            f"Instead received type {type(inp)!r}."
+        )
+        raise MagpylibBadUserInput(msg)
+    inp = make_float_array(inp, param_name)
     for d1, d2 in zip(inp.shape, shape, strict=False):
         if d2 is not None and d1 != d2:
             msg = f"Input parameter `{param_name}` has bad shape."
@@ -5,15 +5,19 @@
 # pylint: disable=cyclic-import
 # pylint: disable=too-many-positional-arguments
 
+from functools import lru_cache
+
 import numpy as np
 
 from magpylib._src.defaults.defaults_utility import (
     ALLOWED_LINESTYLES,
     ALLOWED_SYMBOLS,
+    NUMERIC_TYPES,
     SUPPORTED_PLOTTING_BACKENDS,
     MagicProperties,
     color_validator,
     get_defaults_dict,
+    magic_to_dict,
     validate_property_class,
     validate_style_keys,
 )
@@ -23,6 +27,12 @@ ALLOWED_SIZEMODES = ("scaled", "absolute")
 
 def get_families(obj):
     """get obj families"""
+    return _get_families_from_type(type(obj))
+
+
+@lru_cache(maxsize=128)
+def _get_families_from_type(obj_type):
+    """get families of an object type, computed once per type"""
     # pylint: disable=import-outside-toplevel
     # pylint: disable=possibly-unused-variable
     # pylint: disable=redefined-outer-name
@@ -47,13 +57,13 @@ def get_families(obj):
     loc = locals()
     obj_families = []
     for item, val in loc.items():
-        if not item.startswith("_"):
+        if item != "obj_type" and not item.startswith("_"):
             try:
-                if isinstance(obj, val):
+                if issubclass(obj_type, val):
                     obj_families.append(item.lower())
             except TypeError:
                 pass
-    return obj_families
+    return tuple(obj_families)
 
 
 def get_style(obj, default_settings, **kwargs):
@@ -81,17 +91,19 @@ def get_style(obj, default_settings, **kwargs):
         if family_style:
             family_dict = family_style.as_dict(flatten=True, separator="_")
             base_style_flat.update(
-                {k: v for k, v in family_dict.items() if v is not None}
+                (k, v) for k, v in family_dict.items() if v is not None
             )
     style_kwargs = validate_style_keys(style_kwargs)
 
     # create style class instance and update based on precedence
     style = obj.style.copy()
+    style_props = style._property_names_generator()
     style_kwargs_specific = {
-        k: v for k, v in style_kwargs.items() if k.split("_")[0] in style.as_dict()
+        k: v for k, v in style_kwargs.items() if k.split("_")[0] in style_props
     }
     style.update(**style_kwargs_specific, _match_properties=True)
-    style.update(**base_style_flat, _match_properties=False, _replace_None_only=True)
+    # defaults only fill `None` values, set properties are skipped
+    style._fill_defaults(magic_to_dict(base_style_flat))
 
     return style
 
@@ -146,7 +158,7 @@ class Line(MagicProperties):
 
     @width.setter
     def width(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `width` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
@@ -258,7 +270,7 @@ class BaseStyle(MagicProperties):
 
     @opacity.setter
     def opacity(self, val):
-        assert val is None or (isinstance(val, float | int) and 0 <= val <= 1), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and 0 <= val <= 1), (
             "The `opacity` property must be a value between 0 and 1,\n"
             f"but received {val!r} instead."
         )
@@ -612,7 +624,7 @@ class Trace3d(MagicProperties):
 
     @scale.setter
     def scale(self, val):
-        assert isinstance(val, int | float) and val > 0, (  # noqa: PT018
+        assert isinstance(val, NUMERIC_TYPES) and val > 0, (  # noqa: PT018
             f"The `scale` property of {type(self).__name__} must be a strictly positive number,\n"
             f"but received {val!r} instead."
         )
@@ -851,7 +863,7 @@ class MagnetizationColor(MagicProperties):
 
     @transition.setter
     def transition(self, val):
-        assert val is None or (isinstance(val, float | int) and 0 <= val <= 1), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and 0 <= val <= 1), (
             "color transition must be a value between 0 and 1"
         )
         self._transition = val
@@ -1211,7 +1223,7 @@ class Orientation(MagicProperties):
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `size` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
@@ -1236,7 +1248,7 @@ class Orientation(MagicProperties):
 
     @offset.setter
     def offset(self, val):
-        assert val is None or (isinstance(val, float | int)), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES)), (
             f"The `offset` property must valid number\nbut received {val!r} instead."
         )
         self._offset = val
@@ -1537,7 +1549,7 @@ class SensorProperties:
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `size` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
@@ -1692,7 +1704,7 @@ class Pixel(MagicProperties):
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"the `size` property of {type(self).__name__} must be a positive number"
             f"but received {val!r} instead."
         )
@@ -1869,7 +1881,7 @@ class Arrow(Line):
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `size` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
@@ -1897,7 +1909,7 @@ class Arrow(Line):
 
     @offset.setter
     def offset(self, val):
-        assert val is None or ((isinstance(val, float | int)) and 0 <= val <= 1), (
+        assert val is None or ((isinstance(val, NUMERIC_TYPES)) and 0 <= val <= 1), (
             "The `offset` property must valid number between 0 and 1\n"
             f"but received {val!r} instead."
         )
@@ -1961,7 +1973,7 @@ class Marker(MagicProperties):
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `size` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
@@ -2040,7 +2052,7 @@ class DipoleProperties:
 
     @size.setter
     def size(self, val):
-        assert val is None or (isinstance(val, int | float) and val >= 0), (
+        assert val is None or (isinstance(val, NUMERIC_TYPES) and val >= 0), (
             f"The `size` property of {type(self).__name__} must be a positive number,\n"
             f"but received {val!r} instead."
         )
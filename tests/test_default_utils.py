@@ -70,6 +70,11 @@ def test_magic_to_dict():
     d = {"a.b": 1, "c": 2, "a": 3, "c.d": {"e": 6}}
     res = magic_to_dict(d, separator=".")
     assert res == {"a": 3, "c": {"d": {"e": 6}}}
+    # nested input dicts are not modified in place
+    sub = {"b": 1}
+    res = magic_to_dict({"a": sub, "a_c": 2}, separator="_")
+    assert res == {"a": {"b": 1, "c": 2}}
+    assert sub == {"b": 1}
     with pytest.raises(AssertionError):
         magic_to_dict(0, separator=".")
     with pytest.raises(AssertionError):
@@ -107,6 +112,7 @@ def test_linearize_dict():
         (0.5, True, "#7f7f7f"),
         ("0.5", True, "#7f7f7f"),
         ((127, 127, 127), True, "#7f7f7f"),
+        ([127, 127, 127], True, "#7f7f7f"),
         ("rgb(127, 127, 127)", True, "#7f7f7f"),
         ((0, 0, 0, 0), False, "#000000"),
         ((0.1, 0.2, 0.3), False, "#19334c"),
@@ -117,6 +123,8 @@ def test_good_colors(color, allow_None, color_expected):
     """test color validator based on matploblib validation"""
 
     assert color_validator(color, allow_None=allow_None) == color_expected
+    # validated colors are returned as is when validated again
+    assert color_validator(color_expected, allow_None=True) == color_expected
 
 
 @pytest.mark.parametrize(
@@ -140,6 +148,15 @@ def test_bad_colors(color, allow_None, expected_exception):
         color_validator(color, allow_None=allow_None)
 
 
+def test_color_validator_int_float_tuples():
+    """int and float rgb tuples compare equal but are different colors"""
+    assert color_validator((1, 0, 0)) == "#010000"
+    assert color_validator((1.0, 0.0, 0.0)) == "#ff0000"
+    assert color_validator([1.0, 0.0, 0.0]) == "#ff0000"
+    with pytest.raises(ValueError, match=r"type '<class 'list'>'(.|\n)*\[1, 2\]"):
+        color_validator([1, 2])
+
+
 def test_MagicProperties():
     """test MagicProperties class"""
 
@@ -197,6 +214,15 @@ def test_MagicProperties():
         "prop1": {"prop2": 10}
     }, "magic property setting failed, `prop2` should be remained unchanged `10`"
 
+    # check filling of `None` properties from defaults
+    bp4 = BPsub1(prop1=BPsub2(prop2=None))
+    bp4._fill_defaults({"prop1": {"prop2": 5}, "prop3": 4})
+    assert bp4.as_dict() == {"prop1": {"prop2": 5}}, "filling defaults failed"
+    bp4._fill_defaults({"prop1": {"prop2": 6}})
+    assert bp4.as_dict() == {"prop1": {"prop2": 5}}, (
+        "filling defaults failed, `prop2` should remain unchanged `5`"
+    )
+
     # check copy method
 
     bp3 = bp2.copy()
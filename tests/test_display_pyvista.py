@@ -65,6 +65,97 @@ def test_extra_model3d():
     magpy.show(coll, return_fig=True, backend="pyvista")
 
 
+def test_extra_model3d_scatter3d_line_colors():
+    """test extra model 3d scatter3d with a color per point"""
+    trace_scatter3d = {
+        "constructor": "Scatter3d",
+        "kwargs": {
+            "x": (0, 1, 2),
+            "y": (0, 0, 1),
+            "z": (0, 1, 0),
+            "mode": "lines",
+            "line_color": ["red", "blue", "green"],
+        },
+    }
+    coll = magpy.Collection(style_label="'Scatter3d' trace")
+    coll.style.model3d.add_trace(trace_scatter3d)
+
+    fig = magpy.show(coll, return_fig=True, backend="pyvista")
+    assert isinstance(fig, pv.Plotter)
+    colored = [
+        actor.mapper.dataset
+        for actor in fig.renderer.actors.values()
+        if isinstance(actor, pv.Actor) and "colors" in actor.mapper.dataset.cell_data
+    ]
+    assert len(colored) == 1
+    np.testing.assert_array_equal(
+        colored[0].cell_data["colors"], [(255, 0, 0), (0, 0, 255)]
+    )
+
+
+def test_facecolor_to_int_rgb():
+    """test face colors are mapped to integer rgb, `None` as black"""
+    from magpylib._src.display.backend_pyvista import (  # noqa: PLC0415
+        facecolor_to_int_rgb,
+    )
+
+    rgb = facecolor_to_int_rgb(["blue", None, "#ff0000", "blue"])
+    np.testing.assert_array_equal(
+        rgb, [(0, 0, 255), (0, 0, 0), (255, 0, 0), (0, 0, 255)]
+    )
+
+
+def test_color_to_int_rgb_int_vs_float():
+    """test int (0-255) and float (0-1) rgb colors are not mixed up"""
+    from magpylib._src.display.backend_pyvista import (  # noqa: PLC0415
+        color_to_int_rgb,
+        facecolor_to_int_rgb,
+    )
+
+    assert color_to_int_rgb((1, 0, 0)) == (1, 0, 0)
+    assert color_to_int_rgb((1.0, 0.0, 0.0)) == (255, 0, 0)
+    np.testing.assert_array_equal(
+        facecolor_to_int_rgb([(1, 0, 0)] * 2), [(1, 0, 0)] * 2
+    )
+    np.testing.assert_array_equal(
+        facecolor_to_int_rgb([(1.0, 0.0, 0.0), (0.0, 0.0, 1.0)]),
+        [(255, 0, 0), (0, 0, 255)],
+    )
+
+
+def test_scatter2d_marker_sizes():
+    """test 2d scatter markers are drawn as one scatter plot per marker size"""
+    from magpylib._src.display.backend_pyvista import (  # noqa: PLC0415
+        generic_trace_to_pyvista,
+    )
+
+    src = magpy.magnet.Cuboid(polarization=(0, 0, 1), dimension=(1, 1, 1))
+    sens = magpy.Sensor(position=np.linspace((0, 0, 2), (4, 0, 2), 5))
+    fig = magpy.show(src, sens, output="Bx", backend="pyvista", return_fig=True)
+    (chart,) = fig.renderer.get_charts()
+    scatters = sorted(chart.plots("scatter"), key=lambda p: p.marker_size)
+    assert [p.marker_size for p in scatters] == [3, 15]
+    np.testing.assert_array_equal(scatters[0].x, [0, 1, 2, 3])
+    np.testing.assert_array_equal(scatters[1].x, [4])
+
+    trace = {"type": "scatter", "x": [0, 1, 2, 3, 4], "y": [5, 6, 7, 8, 9]}
+    for size, expected in [
+        ([2, 5, 2, 8, 5], {2: [0, 2], 5: [1, 4], 8: [3]}),
+        (4, {4: [0, 1, 2, 3, 4]}),
+    ]:
+        chart = pv.Chart2D()
+        for tr in generic_trace_to_pyvista({**trace, "marker_size": size}):
+            for k in ("type", "row", "col"):
+                tr.pop(k)
+            chart.scatter(**tr)
+        scatters = list(chart.plots("scatter"))
+        assert len(scatters) == len(expected)
+        for plot, (msize, x) in zip(scatters, expected.items(), strict=True):
+            assert plot.marker_size == msize
+            np.testing.assert_array_equal(plot.x, x)
+            np.testing.assert_array_equal(plot.y, np.array(x) + 5)
+
+
 def test_subplots():
     """Test pyvista animation"""
     # define sensor and source
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from magpylib._src.fields.special_cel import cel, cel0, celv
+from magpylib._src.fields.special_cel import cel, cel0, cel_iter, cel_iter_pair, celv
 from magpylib._src.fields.special_el3 import el3, el3_angle, el3v, el30
 
 
@@ -106,3 +106,17 @@ def test_cels():
 
     np.testing.assert_allclose(res0, res1)
     np.testing.assert_allclose(res1, res2)
+
+
+def test_cel_iter_pair():
+    """test fused cel_iter_pair vs two separate cel_iter evaluations"""
+    N = 999
+    rng = np.random.default_rng()
+    qc = rng.random(N) + 0.01
+    p = 1 + qc
+    cc1, ss1, cc2, ss2 = (rng.random((4, N)) - 0.5) * 10
+
+    res1, res2 = cel_iter_pair(qc, p, cc1, ss1, cc2, ss2)
+
+    np.testing.assert_allclose(res1, cel_iter(qc, p, np.ones(N), cc1, ss1, p, qc))
+    np.testing.assert_allclose(res2, cel_iter(qc, p, np.ones(N), cc2, ss2, p, qc))
@@ -3,6 +3,7 @@ import pytest
 
 import magpylib as magpy
 from magpylib._src.exceptions import MagpylibBadUserInput
+from magpylib._src.fields.field_BH_tetrahedron import point_inside
 
 
 def test_Tetrahedron_repr():
@@ -81,6 +82,28 @@ def test_tetra_in_out():
     np.testing.assert_allclose(Bauto, Bout)
 
 
+def test_tetra_point_inside_boundary():
+    """points on faces, edges and vertices are inside, degenerate tetras are empty"""
+    rng = np.random.default_rng(0)
+    n = 1000
+    vert = rng.normal(size=(n, 4, 3))
+    w = rng.random((n, 1))
+    bary = rng.dirichlet((1, 1, 1), n)
+    obs_vertex = vert[:, 3]
+    obs_edge = w * vert[:, 1] + (1 - w) * vert[:, 2]
+    obs_face = np.einsum("ni,nij->nj", bary, vert[:, 1:])
+    for obs in (obs_vertex, obs_edge, obs_face):
+        assert np.all(point_inside(obs, vert, "auto"))
+
+    center = np.mean(vert, axis=1)
+    obs_out = obs_face + 1e-6 * (obs_face - center)
+    assert not np.any(point_inside(obs_out, vert, "auto"))
+
+    vert_flat = np.array([[(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)]] * 2)
+    obs_flat = np.array([(0.2, 0.2, 0), (0, 0, 0)])
+    np.testing.assert_array_equal(point_inside(obs_flat, vert_flat, "auto"), False)
+
+
 def test_Tetrahedron_volume():
     """Test Tetrahedron volume calculation."""
     vertices = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)]